@@ -1,5 +1,11 @@
+import io
+import json
 import os
+import pathlib
+import re
+import shutil
 import sys
+import tempfile
 import unittest
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
@@ -94,6 +100,14 @@ class TraversalTests(unittest.TestCase):
         obj = Traverser({'@xsi.type': 'value'})
         self.assertEqual(obj['@xsi.type'], 'value')
 
+    def test_keys_shadowed_by_methods(self):
+        keys = ['sort_by', 'group_by', 'aggregate', 'memory_usage', 'load_many']
+        obj = Traverser(dict((key, key.upper()) for key in keys))
+        for key in keys:
+            self.assertTrue(callable(getattr(obj, key)))
+            self.assertEqual(obj[key], key.upper())
+            self.assertEqual(obj.get(key), key.upper())
+
 class BehaviorTests(unittest.TestCase):
 
     def test_eq(self):
@@ -287,17 +301,17 @@ class IDESupportTests(unittest.TestCase):
     def test_dir_for_list(self):
         obj = Traverser([])
         dir_list = sorted([k for k in dir(obj) if not k.startswith('_')])
-        self.assertEqual(dir_list, ['append', 'ensure_list', 'extend', 'get', 'prune', 'set', 'to_json'])
+        self.assertEqual(dir_list, ['aggregate', 'append', 'ensure_list', 'extend', 'get', 'group_by', 'load_many', 'memory_usage', 'prune', 'set', 'sort_by', 'to_json'])
 
     def test_dir_for_dict(self):
         obj = Traverser({'id': 1})
         dir_list = sorted([k for k in dir(obj) if not k.startswith('_')])
-        self.assertEqual(dir_list, ['append', 'ensure_list', 'extend', 'get', 'id', 'prune', 'set', 'to_json'])
+        self.assertEqual(dir_list, ['aggregate', 'append', 'ensure_list', 'extend', 'get', 'group_by', 'id', 'load_many', 'memory_usage', 'prune', 'set', 'sort_by', 'to_json'])
 
     def test_dir_not_including_bad_keys(self):
         obj = Traverser({'id': 1, '@bad': '', 'even.worse': 3})
         dir_list = sorted([k for k in dir(obj) if not k.startswith('_')])
-        self.assertEqual(dir_list, ['append', 'ensure_list', 'extend', 'get', 'id', 'prune', 'set', 'to_json'])
+        self.assertEqual(dir_list, ['aggregate', 'append', 'ensure_list', 'extend', 'get', 'group_by', 'id', 'load_many', 'memory_usage', 'prune', 'set', 'sort_by', 'to_json'])
 
 
 class CallChainingTests(unittest.TestCase):
@@ -384,5 +398,327 @@ class SetTests(unittest.TestCase):
         self.assertEqual(obj.get('root.stuff.parts.0.auto'), 'any')
 
 
+class ListOperationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.obj = Traverser([
+            {'id': 3, 'region': 'east', 'user': {'created': 2}, 'total': 10},
+            {'id': 1, 'region': 'west', 'user': {'created': 1}, 'total': 5},
+            {'id': 2, 'region': 'east', 'user': {'created': 2}},
+            {'id': 4, 'region': 'west'},
+        ])
+
+    def test_sort_by(self):
+        result = self.obj.sort_by('user.created', 'id')
+        self.assertEqual([node.id for node in result], [4, 1, 2, 3])
+        self.assertEqual(result.__class__.__name__, 'Traverser')
+
+    def test_sort_by_reverse(self):
+        result = self.obj.sort_by('id', reverse=True)
+        self.assertEqual([node.id for node in result], [4, 3, 2, 1])
+
+    def test_sort_by_requires_path(self):
+        with self.assertRaises(ValueError):
+            self.obj.sort_by()
+
+    def test_ragged_rows(self):
+        obj = Traverser([
+            {'id': 1, 'tags': ['b']},
+            {'id': 2, 'tags': []},
+            {'id': 3, 'tags': {'a': 1}},
+            {'id': 4, 'tags': ['a']},
+        ])
+        self.assertEqual([node.id for node in obj.sort_by('tags.0')], [2, 3, 4, 1])
+        self.assertEqual([node.id for node in obj.group_by('tags.0')[None]], [2, 3])
+        self.assertEqual(obj.aggregate('tags.0'), 2)
+        self.assertEqual(obj.aggregate('tags.0', 'max'), 'b')
+        self.assertEqual([node.id for node in obj.sort_by('tags.a')], [1, 2, 4, 3])
+        self.assertEqual([node.id for node in obj.group_by('tags.a')[1]], [3])
+        self.assertEqual(obj.aggregate('tags.a', 'sum'), 1)
+
+    def test_group_by_unhashable_value(self):
+        obj = Traverser([{'id': 1, 'user': {'name': 'jdoe'}}])
+        with self.assertRaises(ValueError):
+            obj.group_by('user')
+
+    def test_sort_by_singleton(self):
+        obj = Traverser({'id': 1})
+        self.assertEqual(obj.sort_by('id')(), [{'id': 1}])
+
+    def test_group_by(self):
+        groups = self.obj.group_by('region')
+        self.assertEqual(sorted(groups.keys()), ['east', 'west'])
+        self.assertEqual([node.id for node in groups['east']], [3, 2])
+        self.assertEqual([node.id for node in groups['west']], [1, 4])
+
+    def test_group_by_missing_key(self):
+        groups = self.obj.group_by('user.created')
+        self.assertEqual([node.id for node in groups[None]], [4])
+        self.assertEqual([node.id for node in groups[2]], [3, 2])
+
+    def test_aggregate(self):
+        self.assertEqual(self.obj.aggregate('total'), 2)
+        self.assertEqual(self.obj.aggregate('total', 'sum'), 15)
+        self.assertEqual(self.obj.aggregate('total', 'min'), 5)
+        self.assertEqual(self.obj.aggregate('total', 'max'), 10)
+
+    def test_aggregate_no_values(self):
+        self.assertEqual(self.obj.aggregate('bad_key'), 0)
+        self.assertIsNone(self.obj.aggregate('bad_key', 'sum'))
+
+    def test_aggregate_invalid(self):
+        with self.assertRaises(ValueError):
+            self.obj.aggregate('total', 'avg')
+
+
+class MemoryUsageTests(unittest.TestCase):
+
+    def test_totals(self):
+        obj = Traverser({'users': [{'username': 'jdoe'}], 'count': 1})
+        usage = obj.memory_usage()
+        self.assertEqual(usage['nodes'], 5)
+        self.assertEqual(usage['bytes'], sum(stats['bytes'] for stats in usage['paths'].values()) + sys.getsizeof(obj()))
+        self.assertEqual(sorted(usage['paths'].keys()), ['count', 'users'])
+
+    def test_depth(self):
+        obj = Traverser({'root': {'users': [{'username': 'jdoe'}]}, '@xsi.type': 'field'})
+        usage = obj.memory_usage(depth=3)
+        self.assertEqual(sorted(usage['paths'].keys()), ['@xsi..type', 'root', 'root.users', 'root.users.*'])
+        self.assertEqual(usage['paths']['root.users']['nodes'], 3)
+        self.assertEqual(obj.memory_usage(depth=0)['paths'], {})
+
+    def test_shared_objects_sized_once(self):
+        shared = ['x' * 100]
+        obj = Traverser({'one': shared, 'two': shared}, deepcopy=False)
+        usage = obj.memory_usage()
+        self.assertEqual(usage['nodes'], 5)
+        self.assertEqual(usage['paths']['one']['nodes'], 2)
+        self.assertEqual(usage['paths']['two']['nodes'], 2)
+        sizes = sorted(stats['bytes'] for stats in usage['paths'].values())
+        self.assertEqual(sizes[1] - sizes[0], sys.getsizeof(shared) + sys.getsizeof(shared[0]))
+
+    def test_shared_builtin_values_counted_as_nodes(self):
+        self.assertEqual(Traverser([1] * 1000).memory_usage()['nodes'], 1001)
+        usage = Traverser({'a': None, 'b': None}).memory_usage()
+        self.assertEqual(usage['paths']['a']['nodes'], 1)
+        self.assertEqual(usage['paths']['b']['nodes'], 1)
+
+    def test_list_items_share_a_path(self):
+        obj = Traverser({'items': [{'id': index, 'tags': ['a']} for index in range(100)]})
+        usage = obj.memory_usage(depth=3)
+        self.assertEqual(sorted(usage['paths'].keys()), ['items', 'items.*', 'items.*.id', 'items.*.tags'])
+        self.assertEqual(usage['paths']['items.*']['nodes'], 400)
+
+    def test_sample(self):
+        obj = Traverser({'items': [{'id': 'x' * 50 + str(index)} for index in range(1000)]})
+        exact = obj.memory_usage()
+        estimate = obj.memory_usage(sample=100)
+        self.assertEqual(estimate['nodes'], exact['nodes'])
+        self.assertAlmostEqual(estimate['bytes'] / exact['bytes'], 1, places=2)
+
+    def test_max_paths(self):
+        obj = Traverser(dict(('key{}'.format(index), {'id': index}) for index in range(10)))
+        usage = obj.memory_usage(depth=2, max_paths=3)
+        self.assertEqual(len(usage['paths']), 3)
+        self.assertEqual(usage['nodes'], 21)
+
+    def test_duplicate_strings(self):
+        obj = Traverser(json.dumps([{'name': 'x' * 100}, {'name': 'x' * 100}]))
+        usage = obj.memory_usage()
+        self.assertEqual(usage['duplicate_bytes'], sys.getsizeof('x' * 100))
+
+    def test_largest(self):
+        obj = Traverser({'small': 1, 'large': list(range(100)), 'medium': list(range(10))})
+        largest = obj.memory_usage(top=2)['largest']
+        self.assertEqual([path for path, size in largest], ['large', 'medium'])
+
+
+class SequenceViewTests(unittest.TestCase):
+
+    def setUp(self):
+        self.size = 5000
+
+    def test_slice(self):
+        for size in (10, self.size):
+            obj = Traverser(list(range(size)))
+            self.assertEqual(obj[2:5](), [2, 3, 4])
+            self.assertEqual(obj[:3](), [0, 1, 2])
+            self.assertEqual(obj[-2:](), [size - 2, size - 1])
+            self.assertEqual(obj[1:](), list(range(1, size)))
+
+    def test_slice_with_step(self):
+        for size in (10, self.size):
+            obj = Traverser(list(range(size)))
+            self.assertEqual(obj[1::3](), list(range(size))[1::3])
+            self.assertEqual(obj[::-2](), list(range(size))[::-2])
+
+    def test_slice_of_slice(self):
+        obj = Traverser(list(range(self.size)))
+        page = obj[2:-2][1::2]
+        self.assertEqual(len(page), (self.size - 4) // 2)
+        self.assertEqual(page[0], 3)
+        self.assertEqual(page[-1], self.size - 3)
+        self.assertEqual(list(page), list(range(3, self.size - 2, 2)))
+
+    def test_repeated_reslicing(self):
+        obj = Traverser(list(range(self.size)))
+        page = obj
+        for count in range(2000):
+            page = page[1:]
+        self.assertEqual(page[0], 2000)
+        self.assertEqual(len(page), self.size - 2000)
+        self.assertEqual(page[-1], self.size - 1)
+
+    def test_slice_materializes_when_updated(self):
+        value = [{'id': index} for index in range(self.size)]
+        obj = Traverser(value, deepcopy=False)
+        page = obj[1:]
+        self.assertEqual(page[0].id, 1)
+        page.append({'id': -1})
+        self.assertEqual(len(page), self.size)
+        self.assertEqual(page[-1].id, -1)
+        self.assertEqual(len(value), self.size)
+
+    def test_chained_add(self):
+        for size in (2, self.size):
+            a = Traverser(list(range(size)))
+            b = Traverser([size])
+            c = Traverser({'id': 4})
+            chained = a + b + c
+            self.assertEqual(len(chained), size + 2)
+            self.assertEqual(chained[size], size)
+            self.assertEqual(chained[-1], {'id': 4})
+            self.assertEqual(chained[size - 1:size + 1](), [size - 1, size])
+            with self.assertRaises(IndexError):
+                chained[size + 2]
+            self.assertEqual(chained(), list(range(size + 1)) + [{'id': 4}])
+
+    def test_slice_unaffected_by_later_mutation(self):
+        for size in (4, self.size):
+            obj = Traverser([{'id': index} for index in range(size)])
+            page = obj[1:3]
+            big_page = obj[1:]
+            del obj[0]
+            self.assertEqual(page(), [{'id': 1}, {'id': 2}])
+            self.assertEqual(big_page[0].id, 1)
+            self.assertEqual(len(big_page), size - 1)
+            page = obj[:]
+            obj[0] = {'id': -1}
+            obj.extend([{'id': -2}])
+            self.assertEqual(page[0].id, 1)
+            self.assertEqual(len(page), size - 1)
+
+    def test_slice_unaffected_by_mutation_through_another_traverser(self):
+        obj = Traverser({'users': [{'id': index} for index in range(self.size)]})
+        page = obj.users[0:-1]
+        obj.users.append({'id': -1})
+        obj.users[0] = {'id': -2}
+        self.assertEqual(page[0].id, 0)
+        self.assertEqual(len(page), self.size - 1)
+
+    def test_add_unaffected_by_later_mutation(self):
+        for size in (2, self.size):
+            a = Traverser(list(range(size)))
+            b = Traverser([-1])
+            c = a + b
+            d = c[1:]
+            a.append(99)
+            b.extend([4])
+            self.assertEqual(c(), list(range(size)) + [-1])
+            self.assertEqual(d(), list(range(1, size)) + [-1])
+            self.assertEqual(len(a + b), size + 3)
+
+    def test_small_results_unaffected_by_direct_changes(self):
+        value = [3, 1, 2]
+        obj = Traverser(value, deepcopy=False)
+        page = obj[:2]
+        total = obj + [4]
+        value.sort()
+        self.assertEqual(page(), [3, 1])
+        self.assertEqual(total(), [3, 1, 2, 4])
+
+    def test_extend_with_own_slice(self):
+        obj = Traverser(list(range(self.size)))
+        obj.extend(obj[:-1])
+        self.assertEqual(obj(), list(range(self.size)) + list(range(self.size - 1)))
+
+    def test_extend_with_view(self):
+        obj = Traverser([1])
+        obj.extend(Traverser(list(range(self.size)))[1:])
+        self.assertEqual(obj(), [1] + list(range(1, self.size)))
+
+    def test_view_operations(self):
+        obj = Traverser([{'id': index} for index in range(self.size, 0, -1)]) + [{'id': 0}]
+        self.assertEqual(obj.sort_by('id')[:2](), [{'id': 0}, {'id': 1}])
+        self.assertEqual(obj.get('1.id'), self.size - 1)
+        self.assertTrue({'id': 0} in obj)
+        self.assertEqual(obj, [{'id': index} for index in range(self.size, -1, -1)])
+
+
+class LoadManyTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.paths = []
+        for file_index in range(2):
+            path = os.path.join(self.directory, '{}.ndjson'.format(file_index))
+            with open(path, 'w') as file:
+                for index in range(50):
+                    file.write(json.dumps({'id': file_index * 50 + index, 'username': 'jdoe'}) + '\n')
+                file.write('\n')
+            self.paths.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_load_file_object(self):
+        file = io.StringIO('{"id": 1}\n[2, 3]\n')
+        objs = list(Traverser.load_many(file, workers=1))
+        self.assertEqual([obj() for obj in objs], [{'id': 1}, [2, 3]])
+        self.assertEqual(objs[0].__class__.__name__, 'Traverser')
+
+    def test_load_path(self):
+        objs = list(Traverser.load_many(self.paths[0], workers=1))
+        self.assertEqual([obj.id for obj in objs], list(range(50)))
+
+    def test_load_in_order(self):
+        objs = Traverser.load_many(self.paths, workers=2, chunk_size=7)
+        self.assertEqual([obj.id for obj in objs], list(range(100)))
+
+    def test_load_as_completed(self):
+        objs = Traverser.load_many(self.paths, workers=2, ordered=False, chunk_size=7)
+        self.assertEqual(sorted(obj.id for obj in objs), list(range(100)))
+
+    def test_load_pathlib_path(self):
+        objs = list(Traverser.load_many(pathlib.Path(self.paths[1]), workers=1))
+        self.assertEqual([obj.id for obj in objs], list(range(50, 100)))
+
+    def test_load_splits_on_line_boundaries(self):
+        objs = Traverser.load_many(self.paths[0], workers=1, chunk_size=1)
+        self.assertEqual([obj.id for obj in objs], list(range(50)))
+
+    def test_load_reports_malformed_line(self):
+        with open(self.paths[0], 'a') as file:
+            file.write('{"id": \n')
+        with self.assertRaisesRegex(ValueError, "line 52 of '{}'".format(re.escape(self.paths[0]))):
+            list(Traverser.load_many(self.paths[0], workers=2, chunk_size=100))
+        file = io.StringIO('{"id": 1}\n\n[2, 3\n')
+        with self.assertRaisesRegex(ValueError, "line 3 of '<file>'"):
+            list(Traverser.load_many(file, workers=1))
+
+    def test_load_reports_invalid_utf8_line(self):
+        with open(self.paths[1], 'ab') as file:
+            file.write(b'{"name": "\xff"}\n')
+        with self.assertRaisesRegex(ValueError, "line 52 of '{}'".format(re.escape(self.paths[1]))):
+            list(Traverser.load_many(self.paths[1], workers=1, chunk_size=100))
+
+    def test_load_with_filter(self):
+        id_filter = Filter(blacklist='id')
+        objs = list(Traverser.load_many(self.paths, workers=2, filter=id_filter, chunk_size=30))
+        self.assertEqual(len(objs), 100)
+        self.assertEqual(objs[0](), {'username': 'jdoe'})
+        self.assertTrue(objs[0] == {'id': 1, 'username': 'jdoe'})
+
+
 if __name__ == '__main__':
     unittest.main()
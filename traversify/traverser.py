@@ -1,10 +1,21 @@
 import json
 import inspect
+import os
 import re
+import sys
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from copy import copy, deepcopy
+from itertools import chain
 
 
 IDENTIFIER_REGEX = re.compile(r'^[a-zA-Z_]\w*$')
+LAZY_SIZE = 1000
+VIEWS = {}
+VIEWS_LOCK = threading.Lock()
+VIEWS_SWEEP_SIZE = 64
 
 
 def is_identifier(key):
@@ -12,16 +23,20 @@ def is_identifier(key):
 
 
 def wrap_value(value, deepcopy=False, filter=None):
-    return Traverser(value, deepcopy=deepcopy, filter=filter) if isinstance(value, (list, dict)) else value
+    return Traverser(value, deepcopy=deepcopy, filter=filter) if isinstance(value, (list, dict, SequenceView)) else value
 
 
 def unwrap_value(value):
     return value() if isinstance(value, Traverser) else value
 
 
+def peek_value(value):
+    return value.__traverser__internals__['value'] if isinstance(value, Traverser) else value
+
+
 def recursively_unwrap_value(recursive_value):
     recursive_value = unwrap_value(recursive_value)
-    if type(recursive_value) == list:
+    if type(recursive_value) == list or isinstance(recursive_value, SequenceView):
         return [recursively_unwrap_value(v) for v in recursive_value]
     elif type(recursive_value) == dict:
         return dict([(k, recursively_unwrap_value(v)) for k, v in recursive_value.items()])
@@ -29,7 +44,7 @@ def recursively_unwrap_value(recursive_value):
 
 
 def ensure_list(value):
-    return value if type(value) == list else [value]
+    return value if type(value) == list or isinstance(value, SequenceView) else [value]
 
 
 def split_escaped(path):
@@ -38,7 +53,7 @@ def split_escaped(path):
 
 
 def traverse_path_part(value, part, parts, index, default=None):
-    if isinstance(value, list) and not part.isdigit():
+    if isinstance(value, (list, SequenceView)) and not part.isdigit():
         successful_parts = parts[:index + 1]
         msg = "Unable to traverse list via key, '{}', after traversing {}".format(part, successful_parts)
         raise ValueError(msg)
@@ -48,6 +63,236 @@ def traverse_path_part(value, part, parts, index, default=None):
         return value.get(part, default)
 
 
+def traverse_parts(value, parts, default=None):
+    value = traverse_path_part(value, parts[0], parts, 0, default=default)
+    for index, part in enumerate(parts[1:]):
+        if not isinstance(value, (list, dict, SequenceView)):
+            return None
+        value = traverse_path_part(value, part, parts, index, default=default)
+        if value is None:
+            return None
+    return value
+
+
+def extract_path_value(item, parts):
+    if not isinstance(item, (list, dict, SequenceView)):
+        return None
+    try:
+        return traverse_parts(item, parts)
+    except (IndexError, KeyError, ValueError):
+        return None
+
+
+def extract_path_values(items, path):
+    parts = split_escaped(path)
+    return [extract_path_value(item, parts) for item in items]
+
+
+def sort_key(value):
+    return (value is not None, value)
+
+
+AGGREGATES = {
+    'count': len,
+    'sum': sum,
+    'min': min,
+    'max': max,
+}
+
+
+def join_path(path, key):
+    key = str(key).replace('.', '..')
+    return key if path == '' else '{}.{}'.format(path, key)
+
+
+def measure_memory(value, depth=1, top=10, max_paths=1000, sample=None):
+    paths = {}
+    seen = set()
+    strings = {}
+
+    def account(obj, stats, weight, is_node=True):
+        size = duplicate = 0
+        if id(obj) not in seen:
+            seen.add(id(obj))
+            size = sys.getsizeof(obj) * weight
+            if type(obj) == str and strings.setdefault(obj, id(obj)) != id(obj):
+                duplicate = size
+        for path_stats in stats:
+            path_stats['bytes'] += size
+            path_stats['duplicate_bytes'] += duplicate
+            path_stats['nodes'] += is_node * weight
+
+    def child_stats(path, stats, key):
+        child_path = join_path(path, key)
+        path_stats = paths.get(child_path)
+        if path_stats is None:
+            if len(paths) >= max_paths:
+                return None, stats
+            path_stats = paths[child_path] = {'bytes': 0, 'nodes': 0, 'duplicate_bytes': 0}
+        return child_path, stats + (path_stats,)
+
+    total = {'bytes': 0, 'nodes': 0, 'duplicate_bytes': 0}
+    stack = [(value, '', (total,), None, 1)]
+    while stack:
+        value, path, stats, key, weight = stack.pop()
+        if key is not None:
+            account(key, stats, weight, is_node=False)
+        account(value, stats, weight)
+        tracked = path is not None and len(stats) <= depth
+        if isinstance(value, dict):
+            for child_key, child in value.items():
+                child_path, child_path_stats = child_stats(path, stats, child_key) if tracked else (None, stats)
+                stack.append((child, child_path, child_path_stats, child_key, weight))
+        elif isinstance(value, (list, SequenceView)):
+            child_path, child_path_stats = child_stats(path, stats, '*') if tracked else (None, stats)
+            child_weight = weight
+            if sample is not None and len(value) > sample:
+                step = len(value) / sample
+                child_weight = weight * step
+                value = [value[int(index * step)] for index in range(sample)]
+            stack.extend((child, child_path, child_path_stats, None, child_weight) for child in value)
+
+    for path_stats in chain([total], paths.values()):
+        for name in path_stats:
+            path_stats[name] = int(round(path_stats[name]))
+    largest = sorted(paths.items(), key=lambda item: item[1]['bytes'], reverse=True)[:top]
+    return {
+        'bytes': total['bytes'],
+        'nodes': total['nodes'],
+        'duplicate_bytes': total['duplicate_bytes'],
+        'paths': paths,
+        'largest': [(path, stats['bytes']) for path, stats in largest],
+    }
+
+
+def parse_line(line, filter=None):
+    value = json.loads(line)
+    if filter is not None:
+        filter.prune(value)
+    return value
+
+
+def parse_error(error, name, line_number):
+    return ValueError("Unable to parse line {} of '{}': {}".format(line_number, name, error))
+
+
+def count_lines(path, offset):
+    count = 0
+    with open(path, 'rb') as file:
+        while offset > 0:
+            block = file.read(min(offset, 1 << 20))
+            if not block:
+                break
+            count += block.count(b'\n')
+            offset -= len(block)
+    return count
+
+
+def load_lines(lines, filter=None, name=None, first_line=1):
+    values = []
+    for line_number, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        try:
+            values.append(parse_line(line, filter))
+        except ValueError as error:
+            raise parse_error(error, name, line_number) from error
+    return values
+
+
+def load_range(path, start, end, filter=None):
+    values = []
+    with open(path, 'rb') as file:
+        if start:
+            file.seek(start - 1)
+            file.readline()
+        position = file.tell()
+        while position < end:
+            line = file.readline()
+            if not line:
+                break
+            if line.strip():
+                try:
+                    values.append(parse_line(line, filter))
+                except ValueError as error:
+                    raise parse_error(error, os.fsdecode(path), count_lines(path, position) + 1) from error
+            position += len(line)
+    return values
+
+
+def iter_range_tasks(paths, chunk_size, filter=None):
+    if isinstance(paths, (str, bytes, os.PathLike)):
+        paths = [paths]
+    for path in paths:
+        size = os.path.getsize(path)
+        for start in range(0, size, chunk_size):
+            yield load_range, (path, start, min(start + chunk_size, size), filter)
+
+
+def iter_line_tasks(file, chunk_size, filter=None):
+    name = getattr(file, 'name', '<file>')
+    chunk, size, first_line = [], 0, 1
+    for line_number, line in enumerate(file, 1):
+        chunk.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield load_lines, (chunk, filter, name, first_line)
+            chunk, size, first_line = [], 0, line_number + 1
+    if chunk:
+        yield load_lines, (chunk, filter, name, first_line)
+
+
+def load_tasks(tasks, workers, ordered=True):
+    if workers <= 1:
+        for function, args in tasks:
+            yield function(*args)
+        return
+    pending = deque()
+
+    def finished(limit):
+        while len(pending) > limit:
+            if ordered:
+                yield pending.popleft().result()
+                continue
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                yield future.result()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for function, args in tasks:
+            pending.append(executor.submit(function, *args))
+            for values in finished(workers * 2 - 1):
+                yield values
+        for values in finished(0):
+            yield values
+
+
+def track_view(view, source):
+    global VIEWS_SWEEP_SIZE
+    if type(source) != list:
+        return
+    with VIEWS_LOCK:
+        views = VIEWS.get(id(source))
+        if views is None:
+            if len(VIEWS) >= VIEWS_SWEEP_SIZE:
+                for key in [key for key, views in VIEWS.items() if not views]:
+                    del VIEWS[key]
+                VIEWS_SWEEP_SIZE = max(64, len(VIEWS) * 2)
+            views = VIEWS[id(source)] = weakref.WeakValueDictionary()
+        views[id(view)] = view
+
+
+def freeze_views(value):
+    if type(value) != list:
+        return
+    with VIEWS_LOCK:
+        views = VIEWS.pop(id(value), None)
+        views = list(views.values()) if views else []
+    for view in views:
+        view.freeze()
+
+
 def buildout_path(parts, new_value):
     new_path = new_value
     for part in reversed(parts):
@@ -58,13 +303,81 @@ def buildout_path(parts, new_value):
     return new_path
 
 
+class SequenceView(object):
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SliceView(self, range(len(self))[index])
+        return self.item(index)
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, SequenceView)) or len(self) != len(other):
+            return False
+        return all(left == right for left, right in zip(self, other))
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, list(self))
+
+
+class SliceView(SequenceView):
+    def __init__(self, source, indices):
+        self.source = source
+        self.indices = indices
+        track_view(self, source)
+
+    def freeze(self):
+        self.source = list(self)
+        self.indices = range(len(self.source))
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SliceView(self.source, self.indices[index])
+        return self.source[self.indices[index]]
+
+    def __iter__(self):
+        return map(self.source.__getitem__, self.indices)
+
+
+class ChainView(SequenceView):
+    def __init__(self, sources):
+        self.sources = []
+        for source in sources:
+            self.sources.extend(source.sources if isinstance(source, ChainView) else [source])
+        for source in self.sources:
+            track_view(self, source)
+
+    def freeze(self):
+        self.sources = [list(self)]
+
+    def __len__(self):
+        return sum(len(source) for source in self.sources)
+
+    def item(self, index):
+        if index < 0:
+            index += len(self)
+        if index >= 0:
+            for source in self.sources:
+                if index < len(source):
+                    return source[index]
+                index -= len(source)
+        raise IndexError('list index out of range')
+
+    def __iter__(self):
+        return chain.from_iterable(self.sources)
+
+
 class Traverser(object):
     def __init__(self, value, deepcopy=True, filter=None):
         if hasattr(value, 'json') and inspect.ismethod(value.json):
             value = value.json()
         if type(value) == type(""):
             value = json.loads(value)
-        if not isinstance(value, (list, dict)):
+        if not isinstance(value, (list, dict, SequenceView)):
             raise ValueError("Only list or dict types allowed: '{}'".format(value))
         if deepcopy:
             value = recursively_unwrap_value(value)
@@ -73,15 +386,30 @@ class Traverser(object):
             'filter': filter,
         }
 
+    @classmethod
+    def load_many(cls, paths_or_file, workers=None, filter=None, ordered=True, chunk_size=1 << 20):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if hasattr(paths_or_file, 'read'):
+            tasks = iter_line_tasks(paths_or_file, chunk_size, filter)
+        else:
+            tasks = iter_range_tasks(paths_or_file, chunk_size, filter)
+        for values in load_tasks(tasks, workers, ordered=ordered):
+            for value in values:
+                yield cls(value, deepcopy=False, filter=filter)
+
     def __call__(self):
-        return self.__traverser__internals__['value']
+        value = self.__traverser__internals__['value']
+        if isinstance(value, SequenceView):
+            value = self.__traverser__internals__['value'] = list(value)
+        return value
 
     def to_json(self):
         return json.dumps(self())
 
     def __dir__(self):
         dir_list = dir(Traverser)
-        value = self()
+        value = peek_value(self)
         if type(value) == dict:
             dir_list.extend([k for k in value.keys() if is_identifier(k)])
         return dir_list
@@ -104,15 +432,7 @@ class Traverser(object):
         return 'Traverser({})'.format(json.dumps(self(), indent=2, default=str))
 
     def get(self, attr, default=None):
-        parts = split_escaped(attr)
-        value = traverse_path_part(self(), parts[0], parts, 0, default=default)
-        for index, part in enumerate(parts[1:]):
-            if not isinstance(value, (list, dict)):
-                return None
-            value = traverse_path_part(value, part, parts, index, default=default)
-            if value is None:
-                return None
-        return wrap_value(value)
+        return wrap_value(traverse_parts(peek_value(self), split_escaped(attr), default=default))
 
     def set(self, attr, new_value):
         parts = split_escaped(attr)
@@ -140,27 +460,59 @@ class Traverser(object):
             return value
         return [value]
 
+    def sort_by(self, *paths, reverse=False):
+        if not paths:
+            raise ValueError("sort_by requires at least one path")
+        items = ensure_list(peek_value(self))
+        columns = [[sort_key(v) for v in extract_path_values(items, path)] for path in paths]
+        keys = list(zip(*columns)) if len(columns) > 1 else columns[0]
+        order = sorted(range(len(items)), key=keys.__getitem__, reverse=reverse)
+        return wrap_value([items[i] for i in order])
+
+    def group_by(self, path):
+        items = ensure_list(peek_value(self))
+        groups = {}
+        for key, item in zip(extract_path_values(items, path), items):
+            if isinstance(key, (list, dict)):
+                raise ValueError("Unable to group by '{}', found unhashable value: {}".format(path, key))
+            groups.setdefault(key, []).append(item)
+        return dict((key, wrap_value(group)) for key, group in groups.items())
+
+    def aggregate(self, path, how='count'):
+        if how not in AGGREGATES:
+            raise ValueError("Unknown aggregate, '{}', expected one of {}".format(how, sorted(AGGREGATES)))
+        values = [v for v in extract_path_values(ensure_list(peek_value(self)), path) if v is not None]
+        if how != 'count' and not values:
+            return None
+        return AGGREGATES[how](values)
+
+    def memory_usage(self, depth=1, top=10, max_paths=1000, sample=None):
+        return measure_memory(peek_value(self), depth=depth, top=top, max_paths=max_paths, sample=sample)
+
     def __getitem__(self, index):
         if type(index) == type(''):
             value = self().get(index)
         else:
-            value = self()
-            if type(value) != list:
-                value = [value]
+            value = ensure_list(peek_value(self))
             if type(index) == type(slice(0)):
-                start = 0 if index.start is None else index.start
-                stop = len(value) if index.stop is None else index.stop
-                value = value[start:stop]
+                indices = range(len(value))[index]
+                if len(indices) <= LAZY_SIZE:
+                    value = value[index] if type(value) == list else [value[i] for i in indices]
+                elif isinstance(value, SequenceView):
+                    value = value[index]
+                else:
+                    value = SliceView(value, indices)
             else:
                 value = value[index]
         return wrap_value(value)
 
     def __setitem__(self, index, value):
+        freeze_views(self())
         self()[index] = recursively_unwrap_value(value)
 
     def __eq__(self, other):
         if self.__traverser__internals__['filter'] is None:
-            return self() == unwrap_value(other)
+            return peek_value(self) == peek_value(other)
         else:
             return self.__traverser__internals__['filter'].are_equal(self, other)
 
@@ -178,19 +530,20 @@ class Traverser(object):
         return False
 
     def __len__(self):
-        value = self()
-        return len(value) if type(value) == list else 1
+        return len(ensure_list(peek_value(self)))
 
     def __bool__(self):
         return bool(len(self))
 
     def __delitem__(self, item):
+        freeze_views(self())
         del self()[item]
 
     def append(self, item):
         value = self()
         item = unwrap_value(item)
         if type(value) == list:
+            freeze_views(value)
             value.append(item)
         else:
             self.__traverser__internals__['value'] = [value, item]
@@ -198,19 +551,21 @@ class Traverser(object):
 
     def extend(self, item):
         value = self()
-        items = ensure_list(unwrap_value(item))
+        items = ensure_list(peek_value(item))
         if type(value) == list:
+            freeze_views(value)
             value.extend(items)
         else:
-            self.__traverser__internals__['value'] = [value] + items
+            self.__traverser__internals__['value'] = [value] + list(items)
         return self
 
     def __delattr__(self, item):
+        freeze_views(self())
         del self()[item]
 
     def __iter__(self):
-        value = self()
-        if type(value) == list:
+        value = peek_value(self)
+        if type(value) == list or isinstance(value, SequenceView):
             result = []
             for value in value:
                 result.append(wrap_value(value))
@@ -219,9 +574,11 @@ class Traverser(object):
             return iter([self])
 
     def __add__(self, item):
-        value = ensure_list(self())
-        item = ensure_list(unwrap_value(item))
-        return wrap_value(value + item)
+        value = ensure_list(peek_value(self))
+        item = ensure_list(peek_value(item))
+        if len(value) + len(item) <= LAZY_SIZE:
+            return wrap_value(list(chain(value, item)))
+        return wrap_value(ChainView([value, item]))
 
     def __copy__(self):
         return Traverser(copy(self()))